@@ -1,41 +1,58 @@
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
 import time
 import random
 import json
 import re
+import argparse
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from fake_useragent import UserAgent
+from records import Property, RecordBatch
+
+# selenium, pandas and fake_useragent are imported on the code paths that use
+# them, so building the scraper or running `app.py --help` stays cheap.
 
 class RealEstateScraper:
     def __init__(self):
-        self.user_agent = UserAgent()
+        self._user_agent = None
+        self._chrome_options = None
         self.session = requests.Session()
+        # The User-Agent header is filled in by _rotate_user_agent() on first use
         self.headers = {
-            'User-Agent': self.user_agent.random,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         }
         
-        # Configure Chrome options for Selenium
-        self.chrome_options = Options()
-        self.chrome_options.add_argument("--headless")
-        self.chrome_options.add_argument("--no-sandbox")
-        self.chrome_options.add_argument(f"user-agent={self.user_agent.random}")
-        self.chrome_options.add_argument("--disable-gpu")
-        self.chrome_options.add_argument("--window-size=1920,1080")
+    @property
+    def user_agent(self):
+        """User agent provider, loaded on first use"""
+        if self._user_agent is None:
+            from fake_useragent import UserAgent
+            self._user_agent = UserAgent()
+        return self._user_agent
+    
+    @property
+    def chrome_options(self):
+        """Chrome options for Selenium, built on first use"""
+        if self._chrome_options is None:
+            from selenium.webdriver.chrome.options import Options
+            
+            self._chrome_options = Options()
+            self._chrome_options.add_argument("--headless")
+            self._chrome_options.add_argument("--no-sandbox")
+            self._chrome_options.add_argument(f"user-agent={self.user_agent.random}")
+            self._chrome_options.add_argument("--disable-gpu")
+            self._chrome_options.add_argument("--window-size=1920,1080")
+        return self._chrome_options
+    
+    def _create_driver(self):
+        """Start a new headless Chrome driver"""
+        from selenium import webdriver
+        return webdriver.Chrome(options=self.chrome_options)
         
     def initialize_browser(self):
         """Initialize the Selenium browser for JavaScript-heavy pages"""
-        self.driver = webdriver.Chrome(options=self.chrome_options)
+        self.driver = self._create_driver()
         return self.driver
     
     def _random_delay(self, min_seconds=2, max_seconds=5):
@@ -55,8 +72,12 @@ class RealEstateScraper:
             max_pages: Maximum number of pages to scrape
         
         Returns:
-            List of property dictionaries
+            List of Property records
         """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        
         driver = self.initialize_browser()
         all_properties = []
         
@@ -120,9 +141,13 @@ class RealEstateScraper:
         return all_properties
     
     def _extract_centris_listing(self, url):
-        """Extract data from a single Centris listing page"""
-        driver = webdriver.Chrome(options=self.chrome_options)
-        property_data = {}
+        """Extract a Property from a single Centris listing page (None if the page fails to load)"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        
+        driver = self._create_driver()
+        property_data = None
         
         try:
             driver.get(url)
@@ -131,46 +156,48 @@ class RealEstateScraper:
             )
             
             # Basic listing info
-            property_data["source"] = "Centris"
-            property_data["listing_url"] = url
-            property_data["scrape_date"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            property_data = Property(
+                source="Centris",
+                listing_url=url,
+                scrape_date=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            )
             
             # Property ID
             try:
                 property_id = driver.find_element(By.CSS_SELECTOR, ".property-id").text
-                property_data["property_id"] = property_id.replace("MLS:", "").strip()
+                property_data.property_id = property_id.replace("MLS:", "").strip()
             except:
-                property_data["property_id"] = None
+                property_data.property_id = None
                 
             # Title and Address
             try:
                 title = driver.find_element(By.CSS_SELECTOR, ".property-title").text
-                property_data["title"] = title.strip()
+                property_data.title = title.strip()
             except:
-                property_data["title"] = None
+                property_data.title = None
                 
             try:
                 address = driver.find_element(By.CSS_SELECTOR, ".property-address").text
-                property_data["address"] = address.strip()
+                property_data.address = address.strip()
                 
                 # Try to extract city, province, postal code
                 address_parts = address.split(',')
                 if len(address_parts) >= 2:
-                    property_data["city"] = address_parts[1].strip()
+                    property_data.city = address_parts[1].strip()
                     
                 # Try to extract postal code
                 postal_match = re.search(r'[A-Z]\d[A-Z] \d[A-Z]\d', address)
                 if postal_match:
-                    property_data["postal_code"] = postal_match.group(0)
+                    property_data.postal_code = postal_match.group(0)
             except:
-                property_data["address"] = None
+                property_data.address = None
             
             # Price Information
             try:
                 price = driver.find_element(By.CSS_SELECTOR, ".property-price").text
-                property_data["price"] = price.strip().replace("$", "").replace(",", "")
+                property_data.price = price.strip().replace("$", "").replace(",", "")
             except:
-                property_data["price"] = None
+                property_data.price = None
                 
             # Property Features
             try:
@@ -179,9 +206,9 @@ class RealEstateScraper:
                 for feature in features:
                     feature_text = feature.text
                     if "bed" in feature_text.lower():
-                        property_data["bedrooms"] = re.search(r'\d+', feature_text).group(0)
+                        property_data.bedrooms = re.search(r'\d+', feature_text).group(0)
                     elif "bath" in feature_text.lower():
-                        property_data["bathrooms"] = re.search(r'\d+', feature_text).group(0)
+                        property_data.bathrooms = re.search(r'\d+', feature_text).group(0)
             except:
                 pass
                 
@@ -193,41 +220,41 @@ class RealEstateScraper:
                     value = spec.find_element(By.CSS_SELECTOR, ".spec-value").text.strip()
                     
                     if "year built" in label:
-                        property_data["year_built"] = value
+                        property_data.year_built = value
                     elif "lot size" in label or "land area" in label:
-                        property_data["lot_size"] = value
+                        property_data.lot_size = value
                     elif "living area" in label or "building size" in label:
-                        property_data["building_size"] = value
+                        property_data.building_size = value
                     elif "stories" in label or "floor" in label:
-                        property_data["floors"] = value
+                        property_data.floors = value
                     elif "garage" in label or "parking" in label:
-                        property_data["parking"] = value
+                        property_data.parking = value
             except:
                 pass
                 
             # Get images
             try:
                 image_elements = driver.find_elements(By.CSS_SELECTOR, ".property-images img")
-                property_data["image_urls"] = [img.get_attribute("src") for img in image_elements]
+                property_data.image_urls = [img.get_attribute("src") for img in image_elements]
             except:
-                property_data["image_urls"] = []
+                property_data.image_urls = []
                 
             # Agent info
             try:
                 agent_name = driver.find_element(By.CSS_SELECTOR, ".listing-agent-name").text
-                property_data["agent_name"] = agent_name.strip()
+                property_data.agent_name = agent_name.strip()
                 
                 agency = driver.find_element(By.CSS_SELECTOR, ".listing-agency-name").text
-                property_data["agency"] = agency.strip()
+                property_data.agency = agency.strip()
             except:
                 pass
                 
             # Description
             try:
                 desc = driver.find_element(By.CSS_SELECTOR, ".property-description").text
-                property_data["description"] = desc.strip()
+                property_data.description = desc.strip()
             except:
-                property_data["description"] = None
+                property_data.description = None
                 
             # Get geolocation if available
             try:
@@ -238,8 +265,8 @@ class RealEstateScraper:
                         lat_match = re.search(r'latitude":\s*"?(-?\d+\.\d+)"?', script_content)
                         lng_match = re.search(r'longitude":\s*"?(-?\d+\.\d+)"?', script_content)
                         if lat_match and lng_match:
-                            property_data["latitude"] = lat_match.group(1)
-                            property_data["longitude"] = lng_match.group(1)
+                            property_data.latitude = lat_match.group(1)
+                            property_data.longitude = lng_match.group(1)
             except:
                 pass
             
@@ -259,8 +286,12 @@ class RealEstateScraper:
             max_pages: Maximum number of pages to scrape
         
         Returns:
-            List of property dictionaries
+            List of Property records
         """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        
         driver = self.initialize_browser()
         all_properties = []
         
@@ -316,9 +347,13 @@ class RealEstateScraper:
         return all_properties
     
     def _extract_duproprio_listing(self, url):
-        """Extract data from a single DuProprio listing page"""
-        driver = webdriver.Chrome(options=self.chrome_options)
-        property_data = {}
+        """Extract a Property from a single DuProprio listing page (None if the page fails to load)"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        
+        driver = self._create_driver()
+        property_data = None
         
         try:
             driver.get(url)
@@ -327,43 +362,45 @@ class RealEstateScraper:
             )
             
             # Basic listing info
-            property_data["source"] = "DuProprio"
-            property_data["listing_url"] = url
-            property_data["scrape_date"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            property_data = Property(
+                source="DuProprio",
+                listing_url=url,
+                scrape_date=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            )
             
             # Property ID
             try:
                 property_id = re.search(r'/(\d+)/?', url)
                 if property_id:
-                    property_data["property_id"] = property_id.group(1)
+                    property_data.property_id = property_id.group(1)
             except:
-                property_data["property_id"] = None
+                property_data.property_id = None
                 
             # Title and Address
             try:
                 title = driver.find_element(By.CSS_SELECTOR, ".listing-title").text
-                property_data["title"] = title.strip()
+                property_data.title = title.strip()
             except:
-                property_data["title"] = None
+                property_data.title = None
                 
             try:
                 address = driver.find_element(By.CSS_SELECTOR, ".listing-address").text
-                property_data["address"] = address.strip()
+                property_data.address = address.strip()
                 
                 # Try to extract city, province
                 address_parts = address.split(',')
                 if len(address_parts) >= 2:
-                    property_data["city"] = address_parts[0].strip()
-                    property_data["province"] = address_parts[1].strip()
+                    property_data.city = address_parts[0].strip()
+                    property_data.province = address_parts[1].strip()
             except:
-                property_data["address"] = None
+                property_data.address = None
             
             # Price Information
             try:
                 price = driver.find_element(By.CSS_SELECTOR, ".listing-price").text
-                property_data["price"] = price.strip().replace("$", "").replace(",", "")
+                property_data.price = price.strip().replace("$", "").replace(",", "")
             except:
-                property_data["price"] = None
+                property_data.price = None
                 
             # Property Features - DuProprio has a different structure
             try:
@@ -374,52 +411,52 @@ class RealEstateScraper:
                     value = feature.find_element(By.CSS_SELECTOR, ".feature-value").text
                     
                     if "bedroom" in label:
-                        property_data["bedrooms"] = value.strip()
+                        property_data.bedrooms = value.strip()
                     elif "bathroom" in label:
-                        property_data["bathrooms"] = value.strip()
+                        property_data.bathrooms = value.strip()
                     elif "year built" in label:
-                        property_data["year_built"] = value.strip()
+                        property_data.year_built = value.strip()
                     elif "lot dimensions" in label or "lot size" in label:
-                        property_data["lot_size"] = value.strip()
+                        property_data.lot_size = value.strip()
                     elif "living area" in label or "building size" in label:
-                        property_data["building_size"] = value.strip()
+                        property_data.building_size = value.strip()
                     elif "floor" in label or "level" in label:
-                        property_data["floors"] = value.strip()
+                        property_data.floors = value.strip()
                     elif "garage" in label or "parking" in label:
-                        property_data["parking"] = value.strip()
+                        property_data.parking = value.strip()
                     elif "tax" in label:
                         if "municipal" in label:
-                            property_data["municipal_tax"] = value.strip()
+                            property_data.municipal_tax = value.strip()
                         elif "school" in label:
-                            property_data["school_tax"] = value.strip()
+                            property_data.school_tax = value.strip()
             except:
                 pass
                 
             # Get images
             try:
                 image_elements = driver.find_elements(By.CSS_SELECTOR, ".listing-images img")
-                property_data["image_urls"] = [img.get_attribute("src") for img in image_elements]
+                property_data.image_urls = [img.get_attribute("src") for img in image_elements]
             except:
-                property_data["image_urls"] = []
+                property_data.image_urls = []
                 
             # Seller info (DuProprio is direct from owner)
             try:
                 seller_name = driver.find_element(By.CSS_SELECTOR, ".seller-info .seller-name").text
-                property_data["seller_name"] = seller_name.strip()
+                property_data.seller_name = seller_name.strip()
                 
                 # Be careful with contact info - some sites prohibit scraping this
                 # This is just an example of what might be available
                 seller_phone = driver.find_element(By.CSS_SELECTOR, ".seller-info .seller-phone").text
-                property_data["seller_phone"] = seller_phone.strip()
+                property_data.seller_phone = seller_phone.strip()
             except:
                 pass
                 
             # Description
             try:
                 desc = driver.find_element(By.CSS_SELECTOR, ".listing-description").text
-                property_data["description"] = desc.strip()
+                property_data.description = desc.strip()
             except:
-                property_data["description"] = None
+                property_data.description = None
                 
             # Get geolocation if available
             try:
@@ -430,8 +467,8 @@ class RealEstateScraper:
                         lat_match = re.search(r'latitude":\s*"?(-?\d+\.\d+)"?', script_content)
                         lng_match = re.search(r'longitude":\s*"?(-?\d+\.\d+)"?', script_content)
                         if lat_match and lng_match:
-                            property_data["latitude"] = lat_match.group(1)
-                            property_data["longitude"] = lng_match.group(1)
+                            property_data.latitude = lat_match.group(1)
+                            property_data.longitude = lng_match.group(1)
             except:
                 pass
             
@@ -444,16 +481,55 @@ class RealEstateScraper:
     
     def save_to_csv(self, data, filename):
         """Save scraped data to CSV file"""
-        df = pd.DataFrame(data)
+        df = RecordBatch(Property, data).to_pandas()
         df.to_csv(filename, index=False)
         return filename
     
     def save_to_json(self, data, filename):
         """Save scraped data to JSON file"""
         with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+            json.dump(RecordBatch(Property, data).to_dicts(), f, ensure_ascii=False, indent=4)
         return filename
     
+    def save_to_formats(self, data, base_filename, formats=("csv", "json")):
+        """Save scraped data to each requested format ("csv" and/or "json")"""
+        savers = {"csv": self.save_to_csv, "json": self.save_to_json}
+        return [savers[fmt](data, f"{base_filename}.{fmt}") for fmt in formats]
+    
+    def download_images(self, properties, output_dir="images", max_workers=8, thumbnail_size=None):
+        """
+        Download listing photos into a content-addressed store
+        
+        Args:
+            properties: List of Property records with image_urls
+            output_dir: Root directory of the image store
+            max_workers: Number of concurrent downloads
+            thumbnail_size: (width, height) for thumbnails, or None to skip
+        
+        Returns:
+            The same list, with image_paths added to each property
+        """
+        from image_downloader import ImageDownloader
+        
+        self._rotate_user_agent()
+        downloader = ImageDownloader(
+            output_dir,
+            max_workers=max_workers,
+            headers=self.headers,
+            thumbnail_size=thumbnail_size
+        )
+        image_paths = downloader.download(
+            url for property_data in properties for url in property_data.image_urls or []
+        )
+        
+        for property_data in properties:
+            property_data.image_paths = [
+                image_paths.get(url.strip()) if url else None
+                for url in property_data.image_urls or []
+            ]
+            
+        return properties
+    
     def handle_captcha(self, driver):
         """
         Basic captcha detection - just checks if a captcha might be present
@@ -473,7 +549,8 @@ class RealEstateScraper:
                 
         return False
     
-    def run_centris_scraper(self, search_params=None):
+    def run_centris_scraper(self, search_params=None, images_dir=None, max_pages=5,
+                           formats=("csv", "json"), base_filename="centris_properties"):
         """Run the Centris scraper with common search parameters"""
         # Default search for Montreal properties
         if not search_params:
@@ -482,15 +559,17 @@ class RealEstateScraper:
             # Format search parameters
             search_url = f"https://www.centris.ca/en/properties~for-sale~{search_params}"
             
-        properties = self.scrape_centris(search_url, max_pages=5)
+        properties = self.scrape_centris(search_url, max_pages=max_pages)
         
         if properties:
-            self.save_to_csv(properties, "centris_properties.csv")
-            self.save_to_json(properties, "centris_properties.json")
+            if images_dir:
+                self.download_images(properties, images_dir)
+            self.save_to_formats(properties, base_filename, formats)
             
         return properties
     
-    def run_duproprio_scraper(self, search_params=None):
+    def run_duproprio_scraper(self, search_params=None, images_dir=None, max_pages=5,
+                           formats=("csv", "json"), base_filename="duproprio_properties"):
         """Run the DuProprio scraper with common search parameters"""
         # Default search for Montreal properties
         if not search_params:
@@ -499,21 +578,53 @@ class RealEstateScraper:
             # Format search parameters - this would need adjustment based on DuProprio's format
             search_url = f"https://duproprio.com/en/search/list?search=true&{search_params}"
             
-        properties = self.scrape_duproprio(search_url, max_pages=5)
+        properties = self.scrape_duproprio(search_url, max_pages=max_pages)
         
         if properties:
-            self.save_to_csv(properties, "duproprio_properties.csv")
-            self.save_to_json(properties, "duproprio_properties.json")
+            if images_dir:
+                self.download_images(properties, images_dir)
+            self.save_to_formats(properties, base_filename, formats)
             
         return properties
 
-# Usage example
-if __name__ == "__main__":
-    scraper = RealEstateScraper()
+def main(argv=None):
+    """Command-line entry point: python app.py {centris,duproprio} [options]"""
+    parser = argparse.ArgumentParser(
+        description="Scrape Canadian real-estate listings",
+        epilog='example: python app.py centris --search "montreal?min-price=300000&max-price=500000"'
+    )
+    subparsers = parser.add_subparsers(dest="site", metavar="site")
     
-    # Uncomment to run specific scraper
-    # centris_properties = scraper.run_centris_scraper()
-    # duproprio_properties = scraper.run_duproprio_scraper()
+    for site, help_text in (("centris", "Scrape Centris.ca"), ("duproprio", "Scrape DuProprio.com")):
+        site_parser = subparsers.add_parser(site, help=help_text)
+        site_parser.add_argument("--search", default=None,
+                                 help="Search parameters appended to the site's search URL (default: Montreal)")
+        site_parser.add_argument("--max-pages", type=int, default=5,
+                                 help="Maximum number of result pages to scrape (default: 5)")
+        site_parser.add_argument("--format", dest="formats", nargs="+", choices=["csv", "json"],
+                                 default=["csv", "json"], help="Output formats (default: csv json)")
+        site_parser.add_argument("--output", default=f"{site}_properties",
+                                 help=f"Output file name without extension (default: {site}_properties)")
+        site_parser.add_argument("--images-dir", default=None,
+                                 help="Also download listing photos into this directory")
     
-    # Or run with specific search parameters
-    # centris_properties = scraper.run_centris_scraper("montreal?min-price=300000&max-price=500000")
\ No newline at end of file
+    args = parser.parse_args(argv)
+    if not args.site:
+        parser.print_help()
+        return 1
+    
+    scraper = RealEstateScraper()
+    run = scraper.run_centris_scraper if args.site == "centris" else scraper.run_duproprio_scraper
+    properties = run(
+        args.search,
+        images_dir=args.images_dir,
+        max_pages=args.max_pages,
+        formats=args.formats,
+        base_filename=args.output
+    )
+    
+    print(f"Total properties scraped: {len(properties)}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,220 @@
+import hashlib
+import json
+import mimetypes
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def _make_thumbnail(source_path, thumbnail_path, size):
+    """Render a JPEG thumbnail for one stored image (runs in a worker process)"""
+    from PIL import Image
+
+    with Image.open(source_path) as image:
+        image.thumbnail(size)
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        tmp_path = f"{thumbnail_path}.{os.getpid()}.tmp"
+        image.save(tmp_path, "JPEG")
+    os.replace(tmp_path, thumbnail_path)
+    return thumbnail_path
+
+
+class ImageDownloader:
+    """
+    Concurrent image downloader backed by a content-addressed store
+
+    Images are written once under ``objects/<aa>/<sha256><ext>`` no matter how
+    many URLs point at the same bytes. A ``manifest.json`` maps every fetched
+    URL to its stored object so an interrupted run picks up where it stopped.
+    """
+
+    def __init__(self, output_dir="images", max_workers=8, headers=None,
+                 thumbnail_size=None, thumbnail_workers=None, timeout=30,
+                 checkpoint_every=50):
+        """
+        Args:
+            output_dir (str): Root directory of the image store
+            max_workers (int): Number of concurrent download threads
+            headers (dict): Extra HTTP headers sent with every request
+            thumbnail_size (tuple): (width, height) bound for thumbnails, or None to skip
+            thumbnail_workers (int): Processes used for thumbnails (default: CPU count)
+            timeout (int): Per-request timeout in seconds
+            checkpoint_every (int): Save the manifest after this many downloads
+        """
+        self.output_dir = output_dir
+        self.objects_dir = os.path.join(output_dir, "objects")
+        self.thumbnails_dir = os.path.join(output_dir, "thumbnails")
+        self.manifest_path = os.path.join(output_dir, "manifest.json")
+        self.max_workers = max_workers
+        self.thumbnail_size = thumbnail_size
+        self.thumbnail_workers = thumbnail_workers
+        self.timeout = timeout
+        self.checkpoint_every = checkpoint_every
+
+        # One session with a connection pool sized to the worker count
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers, max_retries=2)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if headers:
+            self.session.headers.update(headers)
+
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self.manifest = self._load_manifest()
+
+        # sha256 -> stored object path, shared by the download threads
+        self._objects = {os.path.basename(path).split(".")[0]: path for path in self.manifest.values()}
+        self._lock = threading.Lock()
+        self.stats = {"downloaded": 0, "duplicates": 0, "resumed": 0, "failed": 0}
+
+    def _load_manifest(self):
+        """Load URL -> object mappings from a previous run, dropping missing files"""
+        if not os.path.exists(self.manifest_path):
+            return {}
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable image manifest {self.manifest_path}: {e}")
+            return {}
+        return {
+            url: path for url, path in manifest.items()
+            if os.path.exists(os.path.join(self.output_dir, path))
+        }
+
+    def _save_manifest(self):
+        """Atomically write the manifest so a crash never leaves it truncated"""
+        tmp_path = f"{self.manifest_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _guess_extension(self, url, content_type):
+        """Pick a file extension from the response Content-Type or the URL"""
+        if content_type:
+            ext = mimetypes.guess_extension(content_type.split(";")[0].strip())
+            if ext:
+                return ".jpg" if ext == ".jpe" else ext
+        ext = os.path.splitext(urlsplit(url).path)[1].lower()
+        return ext if ext else ".jpg"
+
+    def _fetch(self, url):
+        """Download one URL and store it by content hash, returning its relative path"""
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        content = response.content
+        digest = hashlib.sha256(content).hexdigest()
+
+        with self._lock:
+            existing = self._objects.get(digest)
+            if existing:
+                self.stats["duplicates"] += 1
+                return existing
+            ext = self._guess_extension(url, response.headers.get("Content-Type"))
+            rel_path = os.path.join("objects", digest[:2], digest + ext)
+            self._objects[digest] = rel_path
+
+        full_path = os.path.join(self.output_dir, rel_path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        tmp_path = f"{full_path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, full_path)
+
+        with self._lock:
+            self.stats["downloaded"] += 1
+        return rel_path
+
+    def download(self, urls):
+        """
+        Download every distinct URL not already in the store
+
+        Args:
+            urls (iterable): Image URLs; blanks and repeats are ignored
+
+        Returns:
+            dict: URL -> local file path (None for URLs that failed)
+        """
+        unique_urls = []
+        seen = set()
+        for url in urls:
+            if not url or not isinstance(url, str):
+                continue
+            url = url.strip()
+            if url and url not in seen:
+                seen.add(url)
+                unique_urls.append(url)
+
+        pending = [url for url in unique_urls if url not in self.manifest]
+        self.stats["resumed"] += len(unique_urls) - len(pending)
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                futures = {pool.submit(self._fetch, url): url for url in pending}
+                for count, future in enumerate(as_completed(futures), 1):
+                    url = futures[future]
+                    try:
+                        self.manifest[url] = future.result()
+                    except Exception as e:
+                        self.stats["failed"] += 1
+                        print(f"Error downloading image {url}: {e}")
+                    if count % self.checkpoint_every == 0:
+                        self._save_manifest()
+            self._save_manifest()
+
+        print(
+            f"Images: {len(unique_urls)} unique URLs, {self.stats['downloaded']} downloaded, "
+            f"{self.stats['duplicates']} duplicate content, {self.stats['resumed']} already stored, "
+            f"{self.stats['failed']} failed"
+        )
+
+        if self.thumbnail_size:
+            self.generate_thumbnails({self.manifest[url] for url in unique_urls if url in self.manifest})
+
+        return {
+            url: os.path.join(self.output_dir, self.manifest[url]) if url in self.manifest else None
+            for url in unique_urls
+        }
+
+    def thumbnail_path(self, rel_path):
+        """Path of the thumbnail for a stored object"""
+        digest = os.path.basename(rel_path).split(".")[0]
+        return os.path.join(self.thumbnails_dir, digest + ".jpg")
+
+    def generate_thumbnails(self, rel_paths):
+        """
+        Create thumbnails for stored objects in a process pool (requires Pillow)
+
+        Args:
+            rel_paths (iterable): Object paths relative to the store root
+        """
+        try:
+            import PIL  # noqa: F401
+        except ImportError:
+            print("Pillow is not installed; skipping thumbnail generation (pip install Pillow)")
+            return
+
+        os.makedirs(self.thumbnails_dir, exist_ok=True)
+        jobs = [
+            (os.path.join(self.output_dir, rel_path), self.thumbnail_path(rel_path))
+            for rel_path in rel_paths
+            if not os.path.exists(self.thumbnail_path(rel_path))
+        ]
+        if not jobs:
+            return
+
+        with ProcessPoolExecutor(max_workers=self.thumbnail_workers) as pool:
+            futures = {
+                pool.submit(_make_thumbnail, source, target, tuple(self.thumbnail_size)): source
+                for source, target in jobs
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"Error creating thumbnail for {futures[future]}: {e}")
@@ -0,0 +1,129 @@
+import sys
+
+
+class Record:
+    """
+    Base class for fixed-schema, ``__slots__``-based scrape records
+
+    Subclasses list their columns in ``__slots__``; string values of the
+    fields named in ``_interned`` are interned so repeated values such as a
+    city share one string object across every record.
+    """
+    __slots__ = ()
+    _interned = frozenset()
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.pop(name, None))
+        if fields:
+            raise TypeError(f"Unknown {type(self).__name__} fields: {', '.join(fields)}")
+
+    def __setattr__(self, name, value):
+        if name in self._interned and isinstance(value, str):
+            value = sys.intern(value)
+        object.__setattr__(self, name, value)
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({values})"
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def to_dict(self):
+        """Return the record as a plain dictionary (e.g. for JSON output)"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class Property(Record):
+    """One real-estate listing, with the same columns for every source site"""
+    __slots__ = (
+        "source",
+        "listing_url",
+        "scrape_date",
+        "property_id",
+        "title",
+        "address",
+        "city",
+        "province",
+        "postal_code",
+        "price",
+        "bedrooms",
+        "bathrooms",
+        "year_built",
+        "lot_size",
+        "building_size",
+        "floors",
+        "parking",
+        "municipal_tax",
+        "school_tax",
+        "image_urls",
+        "image_paths",
+        "agent_name",
+        "agency",
+        "seller_name",
+        "seller_phone",
+        "description",
+        "latitude",
+        "longitude",
+    )
+    _interned = frozenset(("source", "city", "province", "agency"))
+
+
+class RecordBatch:
+    """
+    Accumulates records of one type and converts them column by column
+
+    Columns are built straight from the record attributes, so no
+    intermediate per-row dictionaries are created on the way to pandas or Arrow.
+    """
+
+    def __init__(self, record_type, records=None):
+        self.record_type = record_type
+        self.records = []
+        if records:
+            self.extend(records)
+
+    def append(self, record):
+        if not isinstance(record, self.record_type):
+            raise TypeError(f"Expected {self.record_type.__name__}, got {type(record).__name__}")
+        self.records.append(record)
+
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    @property
+    def fields(self):
+        return list(self.record_type.__slots__)
+
+    def columns(self):
+        """Return the batch as a {field: list of values} mapping"""
+        return {name: [getattr(record, name) for record in self.records] for name in self.fields}
+
+    def to_pandas(self):
+        """Return the batch as a pandas DataFrame"""
+        import pandas as pd
+
+        return pd.DataFrame(self.columns(), columns=self.fields)
+
+    def to_arrow(self):
+        """Return the batch as a pyarrow Table (requires pyarrow)"""
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("pyarrow is required for RecordBatch.to_arrow(); pip install pyarrow") from None
+
+        return pa.table(self.columns())
+
+    def to_dicts(self):
+        """Return the batch as a list of plain dictionaries"""
+        return [record.to_dict() for record in self.records]
@@ -1,11 +1,14 @@
 import requests
 from bs4 import BeautifulSoup
-import pandas as pd
 from datetime import datetime, timedelta
 import time
 import json
 import re
-import openpyxl
+import argparse
+from records import Book, RecordBatch
+
+# pandas and openpyxl are imported only where a DataFrame or Excel file is
+# built, so running `app.py --help` stays cheap.
 
 class NYTBestsellersScraper:
     def __init__(self):
@@ -29,7 +32,7 @@ class NYTBestsellersScraper:
             day (int): Day of bestseller list
         
         Returns:
-            list: Bestseller books details
+            list: Bestseller Book records
         """
         # Construct full URL with more specific format
         url = f"{self.base_url}{year}/{month:02d}/{day:02d}/combined-print-and-e-book-nonfiction/"
@@ -71,7 +74,7 @@ class NYTBestsellersScraper:
             element (BeautifulSoup): Beautiful Soup element for a book
         
         Returns:
-            dict: Book details
+            Book: Book details, or None if extraction failed
         """
         try:
             # Extract title
@@ -110,26 +113,26 @@ class NYTBestsellersScraper:
             image_elem = element.find('footer', class_='css-1d36f7m')
             image_url = image_elem.find('img')['src'] if image_elem and image_elem.find('img') else None
             
-            return {
-                "title": title,
-                "author": author,
-                "publisher": publisher,
-                "description": description,
-                "new_this_week": new_this_week,
-                "weeks_on_list": weeks_on_list,
-                "isbn": isbn,
-                "image_url": image_url
-            }
+            return Book(
+                title=title,
+                author=author,
+                publisher=publisher,
+                description=description,
+                new_this_week=new_this_week,
+                weeks_on_list=weeks_on_list,
+                isbn=isbn,
+                image_url=image_url
+            )
         except Exception as e:
             print(f"Error extracting book details: {e}")
-            return {}
+            return None
 
 
     def scrape_bestsellers_range(self, start_year=2011, end_year=2024):
         """
         Scrape bestsellers across multiple years
         """
-        all_bestsellers = []
+        all_bestsellers = RecordBatch(Book)
         
         # Generate dates for scraping
         current_date = datetime(start_year, 2, 20)
@@ -146,7 +149,7 @@ class NYTBestsellersScraper:
                 
                 # Add scrape date to each book
                 for book in bestsellers:
-                    book['scrape_date'] = current_date
+                    book.scrape_date = current_date
                 
                 all_bestsellers.extend(bestsellers)
                 
@@ -161,30 +164,120 @@ class NYTBestsellersScraper:
                 # Move to next week even if there's an error
                 current_date += timedelta(days=7)
         
-        return pd.DataFrame(all_bestsellers)
+        return all_bestsellers.to_pandas()
+
+    def download_images(self, dataframe, output_dir='images', max_workers=8, thumbnail_size=None):
+        """
+        Download book covers into a content-addressed store
+        
+        Each cover URL is fetched once, however many weeks the book stays on
+        the list, and identical images served from different URLs are stored once.
+        
+        Args:
+            dataframe (pd.DataFrame): Scraped bestsellers with an image_url column
+            output_dir (str): Root directory of the image store
+            max_workers (int): Number of concurrent downloads
+            thumbnail_size (tuple): (width, height) for thumbnails, or None to skip
+        
+        Returns:
+            pd.DataFrame: The same dataframe with the image_path column filled in
+        """
+        if dataframe.empty or 'image_url' not in dataframe:
+            return dataframe
+        
+        from image_downloader import ImageDownloader
+        
+        downloader = ImageDownloader(
+            output_dir,
+            max_workers=max_workers,
+            headers=self.headers,
+            thumbnail_size=thumbnail_size
+        )
+        image_paths = downloader.download(dataframe['image_url'].dropna().unique())
+        dataframe['image_path'] = dataframe['image_url'].map(image_paths)
+        return dataframe
 
-    def save_to_formats(self, dataframe, base_filename='nyt_bestsellers'):
+    def save_to_formats(self, dataframe, base_filename='nyt_bestsellers', formats=('csv', 'json')):
         """
         Save scraped data to multiple formats
+        
+        Args:
+            dataframe (pd.DataFrame): Scraped bestsellers
+            base_filename (str): Output file name without extension
+            formats (iterable): Any of 'csv', 'json' and 'xlsx'
         """
         # Save to CSV
-        dataframe.to_csv(f'{base_filename}.csv', index=False)
+        if 'csv' in formats:
+            dataframe.to_csv(f'{base_filename}.csv', index=False)
         
         # Save to JSON
-        dataframe.to_json(f'{base_filename}.json', orient='records', indent=2)
+        if 'json' in formats:
+            dataframe.to_json(f'{base_filename}.json', orient='records', indent=2)
         
-        # # Save to Excel
-        # dataframe.to_excel(f'{base_filename}.xlsx', index=False)
+        # Save to Excel
+        if 'xlsx' in formats:
+            try:
+                import openpyxl  # noqa: F401
+            except ImportError:
+                raise ImportError("openpyxl is required for Excel output; pip install openpyxl") from None
+            dataframe.to_excel(f'{base_filename}.xlsx', index=False)
+
+def _parse_date(value):
+    """argparse type for YYYY-MM-DD dates"""
+    try:
+        return datetime.strptime(value, '%Y-%m-%d')
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date '{value}', expected YYYY-MM-DD") from None
 
-def main():
+def main(argv=None):
+    """Command-line entry point: python app.py {range,date} [options]"""
+    parser = argparse.ArgumentParser(description="Scrape the NYT combined print & e-book nonfiction bestseller lists")
+    subparsers = parser.add_subparsers(dest='command', metavar='command')
+    
+    range_parser = subparsers.add_parser('range', help="Scrape every weekly list between two years")
+    range_parser.add_argument('--start-year', type=int, default=2011, help="First year to scrape (default: 2011)")
+    range_parser.add_argument('--end-year', type=int, default=2024, help="Last year to scrape (default: 2024)")
+    
+    date_parser = subparsers.add_parser('date', help="Scrape the list for a single date")
+    date_parser.add_argument('date', type=_parse_date, help="List date as YYYY-MM-DD")
+    
+    for command_parser in (range_parser, date_parser):
+        command_parser.add_argument('--format', dest='formats', nargs='+', choices=['csv', 'json', 'xlsx'],
+                                    default=['csv', 'json'], help="Output formats (default: csv json)")
+        command_parser.add_argument('--output', default='nyt_bestsellers',
+                                    help="Output file name without extension (default: nyt_bestsellers)")
+        command_parser.add_argument('--images-dir', default='images',
+                                    help="Directory for downloaded cover images (default: images)")
+        command_parser.add_argument('--no-images', action='store_true', help="Skip downloading cover images")
+        command_parser.add_argument('--thumbnail-size', type=int, nargs=2, metavar=('WIDTH', 'HEIGHT'),
+                                    default=None, help="Also generate cover thumbnails (requires Pillow)")
+    
+    args = parser.parse_args(argv)
+    if not args.command:
+        # Plain `python app.py` keeps scraping the full default range
+        args = parser.parse_args(['range'])
+    
     scraper = NYTBestsellersScraper()
     
     try:
-        # Scrape bestsellers from 2019-2024
-        bestsellers_df = scraper.scrape_bestsellers_range()
+        if args.command == 'range':
+            bestsellers_df = scraper.scrape_bestsellers_range(args.start_year, args.end_year)
+        else:
+            books = scraper.get_bestsellers_for_date(args.date.year, args.date.month, args.date.day)
+            for book in books:
+                book.scrape_date = args.date
+            bestsellers_df = RecordBatch(Book, books).to_pandas()
+        
+        # Download each unique cover once
+        if not args.no_images:
+            bestsellers_df = scraper.download_images(
+                bestsellers_df,
+                args.images_dir,
+                thumbnail_size=args.thumbnail_size
+            )
         
         # Save to multiple formats
-        scraper.save_to_formats(bestsellers_df)
+        scraper.save_to_formats(bestsellers_df, args.output, args.formats)
         
         print("Scraping completed successfully!")
         print(f"Total books scraped: {len(bestsellers_df)}")
@@ -195,6 +288,9 @@ def main():
     
     except Exception as e:
         print(f"Scraping failed: {e}")
+        return 1
+    
+    return 0
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    raise SystemExit(main())
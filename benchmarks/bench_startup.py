@@ -0,0 +1,109 @@
+"""
+Startup benchmark for the scraper entry points
+
+Measures, in fresh interpreters, how long it takes to import each app.py,
+construct its scraper and run ``app.py --help``, and which heavy optional
+dependencies were loaded along the way.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs N]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROJECTS = {
+    "Canadian_real_estate": "RealEstateScraper",
+    "NYT_BestSellerBooks": "NYTBestsellersScraper",
+}
+
+# Modules that should only be imported on the paths that need them
+HEAVY_MODULES = ("selenium", "pandas", "openpyxl", "fake_useragent", "PIL", "pyarrow")
+
+_PROBE = """
+import sys, time
+start = time.perf_counter()
+import app
+imported = time.perf_counter()
+app.{scraper}()
+constructed = time.perf_counter()
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(imported - start, constructed - imported, ",".join(heavy) or "-")
+"""
+
+
+def _run(args, cwd):
+    return subprocess.run([sys.executable, *args], cwd=cwd, capture_output=True, text=True)
+
+
+def _timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def bench_import(project, scraper, runs):
+    """Median import and construction time (seconds) plus loaded heavy modules"""
+    cwd = os.path.join(ROOT, project)
+    probe = _PROBE.format(scraper=scraper, heavy=HEAVY_MODULES)
+    import_times, construct_times, heavy = [], [], "-"
+    for _ in range(runs):
+        result = _run(["-c", probe], cwd)
+        if result.returncode != 0:
+            error = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "unknown error"
+            raise RuntimeError(error)
+        imported, constructed, heavy = result.stdout.split()
+        import_times.append(float(imported))
+        construct_times.append(float(constructed))
+    return statistics.median(import_times), statistics.median(construct_times), heavy
+
+
+def bench_help(project, runs):
+    """Median wall-clock time (seconds) of `python app.py --help`"""
+    cwd = os.path.join(ROOT, project)
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = _run(["app.py", "--help"], cwd)
+        times.append(time.perf_counter() - start)
+        if result.returncode != 0:
+            error = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "unknown error"
+            raise RuntimeError(error)
+    return statistics.median(times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per measurement (default: 5)")
+    args = parser.parse_args(argv)
+
+    baseline = statistics.median(
+        _timed(lambda: _run(["-c", "pass"], ROOT)) for _ in range(args.runs)
+    )
+    print(f"python -c pass: {baseline * 1000:.1f} ms (interpreter baseline)")
+    print(f"{'project':<24}{'import':>10}{'construct':>12}{'--help':>10}  heavy modules loaded")
+
+    failed = False
+    for project, scraper in PROJECTS.items():
+        try:
+            import_time, construct_time, heavy = bench_import(project, scraper, args.runs)
+            help_time = bench_help(project, args.runs)
+        except RuntimeError as e:
+            failed = True
+            print(f"{project:<24}  failed: {e}")
+            continue
+        print(
+            f"{project:<24}{import_time * 1000:>8.1f}ms{construct_time * 1000:>10.1f}ms"
+            f"{help_time * 1000:>8.1f}ms  {heavy}"
+        )
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())